@@ -1,26 +1,169 @@
 import re
+import ast
+import asyncio
+import json
+import io
 import os  # For fetching environment variables
+import shutil
+import tempfile
 from fastapi import FastAPI, UploadFile, File, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
 import logging
 from fastapi.middleware.cors import CORSMiddleware
 from langdetect import detect, LangDetectException
+import azure.cognitiveservices.speech as speechsdk
 import boto3
+import aioboto3
+import aiofiles
+from aiobotocore.config import AioConfig
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, ClientError
 import pandas as pd
-import requests
+import httpx
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from os import environ
 from fastapi.openapi.docs import get_swagger_ui_html
 
+# Set up logging (configured once at import; messages use %-style args so they are only formatted when emitted)
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Connection pool and retry settings for the async S3 client; aiobotocore ignores botocore's
+# socket options, so keep-alive is configured on the aiohttp connector instead
+S3_CLIENT_CONFIG = AioConfig(
+    max_pool_connections=64,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connector_args={'keepalive_timeout': 60},
+)
+
+# Connection and retry settings for the (sync) Secrets Manager client
+SECRETS_MANAGER_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+
+# Multipart settings for S3 uploads: bodies above 8 MiB are sent as parts, up to 8 at a time
+TRANSFER_CFG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=8)
+
+# Shared async clients, opened once for the lifetime of the app
+http_client = None
+s3_client = None
+
+# Number of Azure speech synthesizers kept connected and ready for use; this also caps concurrent syntheses
+SYNTHESIZER_POOL_SIZE = 3
+_synthesizer_pool = None  # asyncio.Queue of idle (SpeechSynthesizer, Connection) pairs, or None for a slot not yet connected
+_synthesis_executor = None  # Dedicated threads for the blocking SDK calls, one per pool slot
+_synthesizer_tasks = set()  # Background replacements of failed synthesizers, referenced so they are not garbage collected
+
+# Archival S3 uploads (input CSV, SSML) are queued and sent off the request path
+S3_ARCHIVE_MAX_CONCURRENCY = 8  # Archival uploads in flight at once, bounding their share of the S3 connection pool
+S3_ARCHIVE_QUEUE_SIZE = 100  # Uploads waiting to start; once full, further archival copies are dropped
+upload_queue = None
+
+# Background worker that drains queued archival uploads over the shared S3 client, a bounded number at a time
+class S3UploadQueue:
+    def __init__(self, max_concurrency=S3_ARCHIVE_MAX_CONCURRENCY, maxsize=S3_ARCHIVE_QUEUE_SIZE):
+        self._queue = asyncio.Queue(maxsize=maxsize)
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._uploads = set()  # In-flight upload tasks, referenced so they are not garbage collected
+        self._worker = None
+
+    def start(self):
+        self._worker = asyncio.create_task(self._run())
+
+    # Queue bytes for upload to S3 under folder/filename without waiting; returns False if the copy was dropped
+    def put(self, file_data, filename, folder):
+        return self._put_nowait((file_data, filename, folder, False))
+
+    # Queue a temporary file for upload to S3; the file is removed once the upload has finished.
+    # Returns False if the queue is full, in which case the caller still owns (and removes) the file
+    def put_file(self, path, filename, folder):
+        return self._put_nowait((path, filename, folder, True))
+
+    # Archival copies must never hold up a request, so a full queue drops the upload instead of waiting
+    def _put_nowait(self, item):
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            logger.error("Archival upload queue is full; dropping S3 copy of %s", item[1])
+            return False
+
+    # Wait for queued uploads to finish, then stop the worker
+    async def close(self):
+        await self._queue.join()
+        self._worker.cancel()
+
+    async def _run(self):
+        while True:
+            # Take an item only once a slot is free, so a slow upload delays nothing but its own slot
+            await self._slots.acquire()
+            item = await self._queue.get()
+            task = asyncio.create_task(self._upload(*item))
+            self._uploads.add(task)
+            task.add_done_callback(self._upload_done)
+
+    def _upload_done(self, task):
+        self._uploads.discard(task)
+        self._slots.release()
+        self._queue.task_done()
+
+    async def _upload(self, source, filename, folder, is_temp_file):
+        try:
+            if is_temp_file:
+                # aiofiles reads in a worker thread, keeping disk I/O off the event loop
+                async with aiofiles.open(source, "rb") as file_obj:
+                    await upload_file_to_s3(file_obj, filename, folder)
+            else:
+                await upload_file_to_s3(source, filename, folder)
+        except Exception as e:
+            logger.error("Archival upload of %s failed: %s", filename, e)
+        finally:
+            if is_temp_file:
+                await asyncio.to_thread(os.remove, source)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global http_client, s3_client, upload_queue, _synthesizer_pool, _synthesis_executor
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(15.0, connect=5.0),  # Only used for the small voices-list GET, including at startup
+    )
+    _synthesizer_pool = asyncio.Queue(SYNTHESIZER_POOL_SIZE)
+    _synthesis_executor = ThreadPoolExecutor(max_workers=SYNTHESIZER_POOL_SIZE, thread_name_prefix="speech-synthesis")
+    app.state.voice_index = {}
+    prefetch_results = await asyncio.gather(refresh_voice_index(app), prewarm_synthesizers(), return_exceptions=True)
+    if isinstance(prefetch_results[0], Exception):
+        logger.error("Failed to prefetch Azure voices: %s", prefetch_results[0])
+    voice_refresh_task = asyncio.create_task(refresh_voice_index_periodically(app))
+    try:
+        async with aioboto3.Session().client('s3', config=S3_CLIENT_CONFIG) as s3:
+            s3_client = s3
+            upload_queue = S3UploadQueue()
+            upload_queue.start()
+            yield
+            # Let pending archival uploads finish before the S3 client is closed
+            await upload_queue.close()
+    finally:
+        voice_refresh_task.cancel()
+        await http_client.aclose()
+        close_synthesizers()
+
 app = FastAPI(
     title="Audio Generation API",
     description="An API to upload CSVs, generate SSML, and convert it to audio using Azure TTS and S3 integration.",
     version="1.0",
     docs_url=None,  # Disable the default Swagger UI
     redoc_url=None,  # Disable the default ReDoc UI
+    default_response_class=ORJSONResponse,  # Serialize JSON responses with orjson
+    lifespan=lifespan,
 )
 
 # Fetch environment variables for AWS resources
@@ -43,14 +186,15 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-
 # S3 bucket configuration (dynamically fetched from environment variables)
 S3_INPUT_FOLDER = "input/"
 S3_SSML_FOLDER = "ssml/"
 S3_AUDIO_FOLDER = "audio/"
 
+# How often the Azure voices list is refreshed in the background (seconds)
+VOICES_REFRESH_INTERVAL = 3600
+_voice_index_lock = asyncio.Lock()  # Serializes on-demand fetches so concurrent requests share one
+
 # Set up templates folder for serving HTML files
 templates = Jinja2Templates(directory="templates")
 
@@ -68,130 +212,231 @@ async def custom_swagger_ui_html():
 async def homepage(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
-# Function to clean up text (remove placeholders like [PH 0:01:06])
-def clean_text(text):
-    return re.sub(r'\[.*?\]', '', text)
+# Placeholders like [PH 0:01:06], compiled once at import
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
 
-# Function to convert CSV timestamp (mm:ss) to seconds
-def convert_timestamp_to_seconds(timestamp):
-    try:
-        minutes, seconds = map(int, timestamp.split(':'))
-        return minutes * 60 + seconds
-    except ValueError:
-        return 0  # Default to 0 if timestamp is not in correct format
+# Function to clean up a column of text (remove placeholders like [PH 0:01:06])
+def clean_text(texts):
+    return texts.fillna('').astype(str).str.replace(_BRACKET_RE, '', regex=True)
+
+# Function to convert a column of CSV timestamps (mm:ss) to seconds
+def convert_timestamp_to_seconds(timestamps):
+    parts = timestamps.fillna('').astype(str).str.extract(r'^\s*([+-]?\d+)\s*:\s*([+-]?\d+)\s*$')
+    # Default to 0 if timestamp is not in correct format
+    return (parts[0].astype(float) * 60 + parts[1].astype(float)).fillna(0).astype(int)
 
-# Upload file to S3 (use dynamic S3 bucket name)
-def upload_file_to_s3(file_data, filename, folder):
+# Upload file to S3 (use dynamic S3 bucket name); file_data is either bytes or a binary file object
+async def upload_file_to_s3(file_data, filename, folder):
     try:
-        s3_client = boto3.client('s3')
-        s3_client.put_object(Bucket=S3_BUCKET_NAME, Key=f"{folder}{filename}", Body=file_data)
-        logging.info(f"Uploaded {filename} to S3 in folder {folder}")
+        if isinstance(file_data, (bytes, bytearray)):
+            file_data = io.BytesIO(file_data)
+        await s3_client.upload_fileobj(file_data, S3_BUCKET_NAME, f"{folder}{filename}", Config=TRANSFER_CFG)
+        logger.info("Uploaded %s to S3 in folder %s", filename, folder)
         return f"s3://{S3_BUCKET_NAME}/{folder}{filename}"
     except NoCredentialsError as e:
-        logging.error("IAM role or credentials not set correctly")
+        logger.error("IAM role or credentials not set correctly")
         raise e
     except ClientError as e:
-        logging.error(f"Failed to upload file to S3: {e}")
+        logger.error("Failed to upload file to S3: %s", e)
         raise e
 
-# Fetch the Azure API key and region from AWS Secrets Manager
+# Shared Secrets Manager client, one per region
+@lru_cache(maxsize=None)
+def get_secrets_manager_client(region_name=AWS_REGION):
+    return boto3.client(service_name="secretsmanager", region_name=region_name, config=SECRETS_MANAGER_CLIENT_CONFIG)
+
+# Fetch the Azure API key and region from AWS Secrets Manager (cached for the lifetime of the process)
+@lru_cache(maxsize=None)
 def get_azure_secrets(secret_name="azure-secrets", region_name=AWS_REGION):
     try:
-        session = boto3.Session()
-        client = session.client(service_name="secretsmanager", region_name=region_name)
+        client = get_secrets_manager_client(region_name)
         get_secret_value_response = client.get_secret_value(SecretId=secret_name)
         secret = get_secret_value_response["SecretString"]
-        return eval(secret)
+        try:
+            return json.loads(secret)
+        except json.JSONDecodeError:
+            # Secrets stored as a Python dict literal (single quotes) are not valid JSON
+            return ast.literal_eval(secret)
     except NoCredentialsError as e:
-        logging.error("IAM role or credentials not set correctly")
+        logger.error("IAM role or credentials not set correctly")
         raise e
     except ClientError as e:
-        logging.error(f"Failed to retrieve secret: {e}")
+        logger.error("Failed to retrieve secret: %s", e)
         raise e
 
 # Function to retrieve supported voices from Azure Speech API
-def get_supported_voices():
-    azure_secrets = get_azure_secrets()
+async def get_supported_voices():
+    azure_secrets = await asyncio.to_thread(get_azure_secrets)  # Blocking boto3 call; only cached once it succeeds
     AZURE_API_KEY = azure_secrets["AZURE_API_KEY"]
     AZURE_REGION = azure_secrets["AZURE_REGION"]
     
     headers = {
         "Ocp-Apim-Subscription-Key": AZURE_API_KEY,
     }
-    response = requests.get(f"https://{AZURE_REGION}.tts.speech.microsoft.com/cognitiveservices/voices/list", headers=headers)
+    response = await http_client.get(f"https://{AZURE_REGION}.tts.speech.microsoft.com/cognitiveservices/voices/list", headers=headers)
     
     if response.status_code == 200:
         return response.json()
     else:
-        logging.error(f"Failed to fetch Azure voices: {response.status_code} {response.text}")
+        logger.error("Failed to fetch Azure voices: %s %s", response.status_code, response.text)
         raise Exception("Unable to retrieve supported voices from Azure.")
 
-# Function to generate SSML file for the selected language and upload to S3
+# Group the Azure voices by locale, keeping the first male and female voice of each
+def index_voices_by_locale(voices):
+    voice_index = {}
+    for voice in voices:
+        locale_voices = voice_index.setdefault(voice['Locale'], {})
+        for gender in ("Male", "Female"):
+            if gender in voice['Gender']:
+                locale_voices.setdefault(gender, voice['ShortName'])
+    return voice_index
+
+# Fetch the Azure voices and store them on the app, indexed by locale: {locale: {'Male': short_name, 'Female': short_name}}
+async def refresh_voice_index(app):
+    app.state.voice_index = index_voices_by_locale(await get_supported_voices())
+
+# Keep the voice index fresh; a failed refresh keeps serving the previous list
+async def refresh_voice_index_periodically(app):
+    while True:
+        await asyncio.sleep(VOICES_REFRESH_INTERVAL)
+        try:
+            await refresh_voice_index(app)
+        except Exception as e:
+            logger.error("Failed to refresh Azure voices: %s", e)
+
+# Return the voice index prefetched at startup, fetching it now if that failed
+async def get_voice_index(app):
+    if not app.state.voice_index:
+        async with _voice_index_lock:
+            # Another request may have fetched the voices while this one was waiting
+            if not app.state.voice_index:
+                await refresh_voice_index(app)
+    return app.state.voice_index
+
+# Function to generate SSML for the selected language; the S3 upload is archival only and is queued for the background uploader
 def generate_ssml(df, lang_column, male_voice, female_voice, xml_lang):
     if lang_column not in df.columns:
         raise ValueError(f"Column '{lang_column}' not found in the CSV file.")
 
     ssml_filename = f"{uuid.uuid4()}.ssml"
-    ssml_content = f"<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='{xml_lang}'>\n"
-    last_timestamp = 0
-
-    for index, row in df.iterrows():
-        speaker = row.get('Speaker', 'spk_0')
-        transcription = clean_text(row.get(lang_column, ''))
-        if not transcription:
-            continue
-
-        timestamp_seconds = convert_timestamp_to_seconds(row.get('Time Markers', '0:00'))
-        delay = max(0, timestamp_seconds - last_timestamp)
-        last_timestamp = timestamp_seconds
-
-        if delay > 0:
-            ssml_content += f"<break time='{delay}s' />\n"
-
-        voice = male_voice if speaker == 'spk_0' else female_voice
-        ssml_content += f"<voice name='{voice}'>{transcription}</voice>\n"
-    
-    ssml_content += "</speak>"
-
-    # Upload SSML content directly to S3
-    ssml_s3_path = upload_file_to_s3(ssml_content.encode('utf-8'), ssml_filename, S3_SSML_FOLDER)
 
-    return ssml_s3_path
+    # Rows without a transcription are skipped and do not advance the timeline
+    texts = clean_text(df[lang_column])
+    texts = texts[texts.ne('')]
+    rows = df.loc[texts.index]
 
-# Function to convert SSML file to audio using Azure TTS API and upload to S3
-async def convert_ssml_to_audio(ssml_s3_path):
-    azure_secrets = get_azure_secrets()
-    AZURE_API_KEY = azure_secrets["AZURE_API_KEY"]
-    AZURE_REGION = azure_secrets["AZURE_REGION"]
+    if 'Time Markers' in rows.columns:
+        timestamps = convert_timestamp_to_seconds(rows['Time Markers'])
+    else:
+        timestamps = pd.Series(0, index=texts.index)
+    delays = (timestamps - timestamps.shift(fill_value=0)).clip(lower=0)
+    breaks = ("<break time='" + delays.astype(str) + "s' />\n").where(delays > 0, '')
 
-    # Extract bucket and key from the S3 path (s3://bucket/key)
-    s3_bucket = S3_BUCKET_NAME
-    s3_key = ssml_s3_path.split(f"s3://{S3_BUCKET_NAME}/")[1]  # Extract the key from the S3 path
+    speakers = rows['Speaker'] if 'Speaker' in rows.columns else pd.Series('spk_0', index=texts.index)
+    voices = pd.Series(female_voice, index=texts.index).where(speakers.ne('spk_0'), male_voice)
 
-    # Initialize S3 client to fetch SSML content
-    s3_client = boto3.client('s3')
-    ssml_object = s3_client.get_object(Bucket=s3_bucket, Key=s3_key)
-    ssml_data = ssml_object['Body'].read().decode('utf-8')  # Read SSML data from S3
+    parts = [f"<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='{xml_lang}'>\n"]
+    parts.extend(breaks + "<voice name='" + voices + "'>" + texts + "</voice>\n")
+    parts.append("</speak>")
+    ssml_content = ''.join(parts)
 
-    headers = {
-        "Ocp-Apim-Subscription-Key": AZURE_API_KEY,
-        "Content-Type": "application/ssml+xml",
-        "X-Microsoft-OutputFormat": "riff-24khz-16bit-mono-pcm"
-    }
+    ssml_data = ssml_content.encode('utf-8')
 
-    response = requests.post(f"https://{AZURE_REGION}.tts.speech.microsoft.com/cognitiveservices/v1", headers=headers, data=ssml_data)
+    # Archive the SSML to S3 while the caller carries on with synthesis
+    upload_queue.put(ssml_data, ssml_filename, S3_SSML_FOLDER)
 
-    logging.info(f"Azure API Response Status: {response.status_code}")
+    return ssml_data
 
-    if response.status_code == 200:
+# Create an Azure speech synthesizer and open its WebSocket connection up front; the connection
+# is returned with the synthesizer so it stays referenced for as long as the synthesizer is pooled
+def create_synthesizer():
+    azure_secrets = get_azure_secrets()
+    speech_config = speechsdk.SpeechConfig(subscription=azure_secrets["AZURE_API_KEY"], region=azure_secrets["AZURE_REGION"])
+    speech_config.set_speech_synthesis_output_format(speechsdk.SpeechSynthesisOutputFormat.Riff24Khz16BitMonoPcm)
+    synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)  # Keep audio in memory
+    connection = speechsdk.Connection.from_speech_synthesizer(synthesizer)
+    connection.open(True)
+    return synthesizer, connection
+
+# Create a synthesizer on the dedicated executor; returns None (an empty pool slot) if Azure cannot be reached
+async def create_pooled_synthesizer():
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_synthesis_executor, create_synthesizer)
+    except Exception as e:
+        logger.error("Failed to create Azure speech synthesizer: %s", e)
+        return None
+
+# Fill the synthesizer pool at startup so the first requests skip the connection setup
+async def prewarm_synthesizers():
+    for pair in await asyncio.gather(*(create_pooled_synthesizer() for _ in range(SYNTHESIZER_POOL_SIZE))):
+        _synthesizer_pool.put_nowait(pair)
+
+# Replace a failed synthesizer in the background so its pool slot is refilled without delaying the caller
+def replace_synthesizer_in_background():
+    async def replace():
+        _synthesizer_pool.put_nowait(await create_pooled_synthesizer())
+
+    task = asyncio.create_task(replace())
+    _synthesizer_tasks.add(task)
+    task.add_done_callback(_synthesizer_tasks.discard)
+
+# Close the pooled connections and stop the synthesis threads at shutdown
+def close_synthesizers():
+    for task in _synthesizer_tasks:
+        task.cancel()
+    while _synthesizer_pool and not _synthesizer_pool.empty():
+        pair = _synthesizer_pool.get_nowait()
+        if pair is not None:
+            pair[1].close()
+    if _synthesis_executor:
+        _synthesis_executor.shutdown(wait=False, cancel_futures=True)
+
+# Function to convert SSML content to audio using the Azure Speech SDK and upload to S3
+async def convert_ssml_to_audio(ssml_data):
+    # Wait for a free pool slot; slots whose connection could not be opened yet are connected now
+    pair = await _synthesizer_pool.get()
+    if pair is None:
+        pair = await create_pooled_synthesizer()
+        if pair is None:
+            _synthesizer_pool.put_nowait(None)
+            raise Exception("Unable to connect to the Azure speech service.")
+    synthesizer, connection = pair
+
+    healthy = False
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(
+            _synthesis_executor, lambda: synthesizer.speak_ssml_async(ssml_data.decode('utf-8')).get()
+        )
+        healthy = result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted
+    except asyncio.CancelledError:
+        # Cancelling the task does not interrupt the SDK call in its worker thread; stop the synthesis itself
+        synthesizer.stop_speaking_async()
+        raise
+    finally:
+        # Healthy synthesizers go back to the pool; failed ones are closed and replaced in the background
+        if healthy:
+            _synthesizer_pool.put_nowait(pair)
+        else:
+            connection.close()
+            replace_synthesizer_in_background()
+
+    logger.info("Azure synthesis result: %s", result.reason)
+
+    if healthy:
         audio_filename = f"{uuid.uuid4()}.wav"
         # Upload audio content directly to S3
-        audio_s3_path = upload_file_to_s3(response.content, audio_filename, S3_AUDIO_FOLDER)
+        audio_s3_path = await upload_file_to_s3(result.audio_data, audio_filename, S3_AUDIO_FOLDER)
 
         return audio_s3_path
     else:
-        logging.error(f"Error from Azure API: {response.text}")
-        raise Exception(f"Error from Azure API: {response.text}")
+        error_details = result.cancellation_details.error_details if result.cancellation_details else result.reason
+        logger.error("Error from Azure API: %s", error_details)
+        raise Exception(f"Error from Azure API: {error_details}")
+
+# Generate SSML for one language column and synthesize it to audio, returning the audio's S3 path
+async def generate_audio(df, lang_column, male_voice, female_voice, xml_lang):
+    ssml_data = generate_ssml(df, lang_column, male_voice, female_voice, xml_lang)
+    return await convert_ssml_to_audio(ssml_data)
 
 # Function to assume the role and get temporary credentials
 # Commented out the assume_role functionality as requested
@@ -220,9 +465,15 @@ async def convert_ssml_to_audio(ssml_s3_path):
 #         )
 #         return session
 #     except ClientError as e:
-#         logging.error(f"Failed to assume role: {e}")
+#         logger.error("Failed to assume role: %s", e)
 #         raise e
 
+# Stream an uploaded file to a temporary file on disk and return its path (caller removes it)
+def save_upload_to_tempfile(upload, suffix=".csv"):
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(upload.file, tmp, length=1 << 20)  # Copy in 1 MiB chunks
+    return tmp.name
+
 # Helper function to detect language
 def detect_language(text):
     try:
@@ -237,57 +488,85 @@ def find_transcription_column(df, locale_code):
             return column
     return None
 
+# Columns used for SSML generation besides the source-language transcription column
+CSV_BASE_COLUMNS = ('Time Markers', 'Speaker', 'EN--Transcription')
+
+# Read only the columns needed for SSML generation; returns the DataFrame and the source transcription column
+def read_transcription_csv(csv_path, locale_code):
+    header = pd.read_csv(csv_path, encoding="utf-8", nrows=0)
+    transcription_column = find_transcription_column(header, locale_code)
+    usecols = [column for column in header.columns if column in CSV_BASE_COLUMNS or column == transcription_column]
+    df = pd.read_csv(csv_path, encoding="utf-8", engine="c", usecols=usecols, dtype={'Speaker': 'category'})
+    return df, transcription_column
+
 # Endpoint to handle file upload, locale selection (renamed to source), and SSML processing
 @app.post("/upload-csv/")
-async def upload_csv(file: UploadFile = File(...), source: str = Form(...)):
+async def upload_csv(request: Request, file: UploadFile = File(...), source: str = Form(...)):
     try:
         source_cleaned = source.strip().replace("\\", "").replace("\n", "").replace("\t", "")
-        contents = await file.read()
+        locale_code = source_cleaned.split('-')[-1]
+        csv_path = await asyncio.to_thread(save_upload_to_tempfile, file)
+        archive_scheduled = False
         try:
-            df = pd.read_csv(pd.io.common.StringIO(contents.decode("utf-8")), encoding="utf-8")
-        except UnicodeDecodeError:
-            logging.error("File encoding is not supported. Please ensure the file is UTF-8 encoded.")
-            return {"error": "File encoding is not supported. Please ensure the file is UTF-8 encoded."}
-
-        # Upload the input CSV to S3
-        input_filename = f"{uuid.uuid4()}.csv"
-        upload_file_to_s3(contents, input_filename, S3_INPUT_FOLDER)
-
-        supported_voices = get_supported_voices()
-
-        source_voices = [v for v in supported_voices if source_cleaned == v['Locale']]
+            try:
+                df, transcription_column = await asyncio.to_thread(read_transcription_csv, csv_path, locale_code)
+            except UnicodeDecodeError:
+                logger.error("File encoding is not supported. Please ensure the file is UTF-8 encoded.")
+                return {"error": "File encoding is not supported. Please ensure the file is UTF-8 encoded."}
+            except pd.errors.ParserError as e:
+                logger.error("Failed to parse CSV file: %s", e)
+                return {"error": "Unable to parse the CSV file. Please ensure it is a valid CSV."}
+
+            # Queue the input CSV for archival to S3; once queued, the uploader removes the temporary file
+            input_filename = f"{uuid.uuid4()}.csv"
+            archive_scheduled = upload_queue.put_file(csv_path, input_filename, S3_INPUT_FOLDER)
+        finally:
+            if not archive_scheduled:
+                os.remove(csv_path)
+
+        source_voices = (await get_voice_index(request.app)).get(source_cleaned)
 
         if not source_voices:
-            logging.error(f"Invalid locale input: {source_cleaned}")
+            logger.error("Invalid locale input: %s", source_cleaned)
             return {"error": "Invalid locale specified or locale not supported."}
 
-        male_voice = next((v['ShortName'] for v in source_voices if "Male" in v['Gender']), None)
-        female_voice = next((v['ShortName'] for v in source_voices if "Female" in v['Gender']), None)
+        male_voice = source_voices.get("Male")
+        female_voice = source_voices.get("Female")
 
         if not male_voice or not female_voice:
-            logging.error(f"Male or female voice not found for {source_cleaned}")
+            logger.error("Male or female voice not found for %s", source_cleaned)
             return {"error": f"Male or female voice not found for {source_cleaned}."}
 
-        # Generate SSML for English and source language
-        ssml_file_path_en = generate_ssml(df, 'EN--Transcription', 'en-US-GuyNeural', 'en-US-JennyNeural', 'en-US')
-        audio_file_en = await convert_ssml_to_audio(ssml_file_path_en)
-
-        locale_code = source_cleaned.split('-')[-1]
-        transcription_column = find_transcription_column(df, locale_code)
-
         if not transcription_column:
-            logging.error(f"CSV is missing a column containing '{locale_code}--Transcription' for the specified language.")
+            logger.error("CSV is missing a column containing '%s--Transcription' for the specified language.", locale_code)
             return {"error": f"CSV must contain a column with '{locale_code}--Transcription' for the specified language."}
 
-        first_transcription = df[transcription_column].dropna().iloc[0]
-        detected_language = detect_language(first_transcription)
+        # Detect the language from the first source transcription that still has text once placeholders are removed
+        source_texts = clean_text(df[transcription_column])
+        source_texts = source_texts[source_texts.ne('')]
+        if source_texts.empty:
+            logger.error("Column '%s' has no transcribable text after removing placeholders", transcription_column)
+            return {"error": f"Column '{transcription_column}' does not contain any transcribable text."}
+
+        detected_language = detect_language(source_texts.iat[0])
         
         if locale_code == "IN" and detected_language != "hi":
-            logging.error(f"Detected language '{detected_language}' does not match the expected language 'Hindi' for 'IN--Transcription'")
+            logger.error("Detected language '%s' does not match the expected language 'Hindi' for 'IN--Transcription'", detected_language)
             return {"error": f"Detected language '{detected_language}' does not match the expected language 'Hindi' in 'IN--Transcription'."}
 
-        ssml_file_path_source = generate_ssml(df, transcription_column, male_voice, female_voice, source_cleaned)
-        audio_file_source = await convert_ssml_to_audio(ssml_file_path_source)
+        # Generate audio for English and source language concurrently
+        audio_tasks = [
+            asyncio.create_task(generate_audio(df, 'EN--Transcription', 'en-US-GuyNeural', 'en-US-JennyNeural', 'en-US')),
+            asyncio.create_task(generate_audio(df, transcription_column, male_voice, female_voice, source_cleaned)),
+        ]
+        try:
+            audio_file_en, audio_file_source = await asyncio.gather(*audio_tasks)
+        except BaseException:
+            # Cancel the other pipeline; convert_ssml_to_audio stops its in-flight synthesis and skips the audio upload
+            for task in audio_tasks:
+                task.cancel()
+            await asyncio.gather(*audio_tasks, return_exceptions=True)
+            raise
 
         # Return URLs for the generated audio files
         return {
@@ -297,8 +576,8 @@ async def upload_csv(file: UploadFile = File(...), source: str = Form(...)):
         }
 
     except ValueError as ve:
-        logging.error(f"ValueError: {str(ve)}")
+        logger.error("ValueError: %s", ve)
         return {"error": str(ve)}
     except Exception as e:
-        logging.error(f"Error processing file. {str(e)}")
+        logger.error("Error processing file. %s", e)
         return {"error": f"Error processing file. {str(e)}"}